@@ -1,5 +1,6 @@
 import asyncio
 import itertools
+import time
 from datetime import timedelta
 
 import pytest
@@ -28,12 +29,92 @@ async def test_aio_timeout_generator(timeout, interval, interval_multiplier,
     assert i == result
 
 
+@pytest.mark.asyncio
+async def test_aio_timeout_generator_default_iterable():
+    i = None
+    async for i in python_utils.aio_timeout_generator(0.1, 0.06):
+        pass
+
+    assert i == 2
+
+
+async def never_suspends(stop):
+    # Unlike `python_utils.acount` this never awaits so it never yields
+    # control to the event loop by itself
+    for i in range(stop):
+        yield i
+
+
+@pytest.mark.parametrize('yield_every,sleeps', [(1, 10), (3, 3), (20, 0)])
+@pytest.mark.asyncio
+async def test_aio_timeout_generator_zero_interval(
+    monkeypatch, yield_every, sleeps
+):
+    sleep_calls = []
+    sleep = asyncio.sleep
+
+    async def counting_sleep(delay, *args, **kwargs):
+        sleep_calls.append(delay)
+        return await sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, 'sleep', counting_sleep)
+
+    i = None
+    async for i in python_utils.aio_timeout_generator(
+        1, 0, never_suspends(10), yield_every=yield_every,
+    ):
+        pass
+
+    assert i == 9
+    assert sleep_calls == [0] * sleeps
+
+
+@pytest.mark.asyncio
+async def test_aio_timeout_generator_never_suspending_timeout():
+    start = time.perf_counter()
+    i = None
+    async for i in python_utils.aio_timeout_generator(
+        0.01, 0, never_suspends(10 ** 7), yield_every=10 ** 9,
+    ):
+        pass
+
+    assert i < 10 ** 7 - 1
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_aio_timeout_generator_blocking_consumer():
+    items = []
+    async for i in python_utils.aio_timeout_generator(0.05, 0.01):
+        items.append(i)
+        # Block the event loop past the timeout
+        time.sleep(0.1)
+
+    assert items == [0]
+
+
+@pytest.mark.parametrize('yield_every', [0, -1])
+@pytest.mark.asyncio
+async def test_aio_timeout_generator_invalid_yield_every(yield_every):
+    with pytest.raises(ValueError):
+        async for i in python_utils.aio_timeout_generator(
+            1, 0, never_suspends(10), yield_every=yield_every,
+        ):
+            pass
+
+
 @pytest.mark.parametrize(
     'timeout,interval,interval_multiplier,maximum_interval,iterable,result', [
         (0.01, 0.006, 0.5, 0.01, 'abc', 'c'),
-        (0.01, 0.006, 0.5, 0.01, itertools.count, 2),
-        (0.01, 0.006, 0.5, 0.01, itertools.count(), 2),
+        (0.01, 0.006, 2.0, 0.01, itertools.count, 2),
+        (0.01, 0.006, 2.0, 0.01, itertools.count(), 2),
+        # Growing intervals: items at 0, 0.02, 0.06 and 0.14 seconds
+        (0.1, 0.02, 2.0, None, itertools.count, 3),
+        # Capped at 0.03: items at 0, 0.02, 0.05, 0.08 and 0.11 seconds
+        (0.1, 0.02, 2.0, 0.03, itertools.count, 4),
         (0.01, 0.006, 1.0, None, 'abc', 'c'),
+        (float('inf'), 0.001, 1.0, None, 'abc', 'c'),
+        (float('-inf'), 0.001, 1.0, None, 'abc', 'a'),
         (timedelta(seconds=0.01),
          timedelta(seconds=0.006),
          2.0, timedelta(seconds=0.01),
@@ -2,15 +2,12 @@ import asyncio
 import datetime
 import functools
 import itertools
+import math
 import time
 
 import python_utils
 from python_utils import aio, exceptions, types
 
-# There might be a better way to get the epoch with tzinfo, please create
-# a pull request if you know a better way that functions for Python 2 and 3
-epoch = datetime.datetime(year=1970, month=1, day=1)
-
 
 def timedelta_to_seconds(delta: datetime.timedelta) -> types.Number:
     '''Convert a timedelta to seconds with the microseconds as fraction
@@ -28,14 +25,7 @@ def timedelta_to_seconds(delta: datetime.timedelta) -> types.Number:
     >>> '%.6f' % timedelta_to_seconds(timedelta(microseconds=1))
     '0.000001'
     '''
-    # Only convert to float if needed
-    if delta.microseconds:
-        total = delta.microseconds * 1e-6
-    else:
-        total = 0
-    total += delta.seconds
-    total += delta.days * 60 * 60 * 24
-    return total
+    return delta.total_seconds()
 
 
 def delta_to_seconds(interval: types.delta_type) -> float:
@@ -43,7 +33,7 @@ def delta_to_seconds(interval: types.delta_type) -> float:
     Convert a timedelta to seconds
 
     >>> delta_to_seconds(datetime.timedelta(seconds=1))
-    1
+    1.0
     >>> delta_to_seconds(datetime.timedelta(seconds=1, microseconds=1))
     1.000001
     >>> delta_to_seconds(1)
@@ -54,7 +44,7 @@ def delta_to_seconds(interval: types.delta_type) -> float:
     TypeError: Unknown type ...
     '''
     if isinstance(interval, datetime.timedelta):
-        return timedelta_to_seconds(interval)
+        return interval.total_seconds()
     elif isinstance(interval, (int, float)):
         return interval
     else:
@@ -70,6 +60,136 @@ def delta_to_seconds_or_none(
         return delta_to_seconds(interval)
 
 
+# Note that `timedelta.max.total_seconds()` rounds up to a float outside of the
+# `timedelta` range so it has to be used as an exclusive upper bound
+_TIMEDELTA_MIN_SECONDS = datetime.timedelta.min.total_seconds()
+_TIMEDELTA_MAX_SECONDS = datetime.timedelta.max.total_seconds()
+
+
+# Preformatted hours and zero padded minutes/seconds for `_fast_hms`
+_HOURS = tuple(str(i) for i in range(24))
+_TWO_DIGITS = tuple('%02d' % i for i in range(60))
+
+
+def _fast_hms(seconds: int) -> str:
+    '''Formats a whole number of seconds within a single day as H:MM:SS
+
+    >>> _fast_hms(3661)
+    '1:01:01'
+    '''
+    return (
+        _HOURS[seconds // 3600] + ':' +
+        _TWO_DIGITS[seconds // 60 % 60] + ':' +
+        _TWO_DIGITS[seconds % 60]
+    )
+
+
+def _format_hms(seconds: float, precision_seconds: float) -> str:
+    '''Formats seconds the same way as `str(datetime.timedelta)` does without
+    creating the intermediate `datetime.timedelta` object
+
+    >>> _format_hms(3661.5, 1)
+    '1:01:01'
+    >>> _format_hms(3661.5, 0.5)
+    '1:01:01.500000'
+    >>> _format_hms(90000, 1)
+    '1 day, 1:00:00'
+    >>> _format_hms(-1, 1)
+    '-1 day, 23:59:59'
+    '''
+    # Truncate the number to the given precision
+    seconds = seconds - (seconds % precision_seconds)
+
+    # Fast path for the common case of whole seconds within a single day
+    int_seconds = int(seconds)
+    if int_seconds == seconds and 0 <= int_seconds < 86400:
+        return _fast_hms(int_seconds)
+
+    # Split off the whole seconds first so large values keep their precision
+    whole_seconds = math.floor(seconds)
+    microseconds = whole_seconds * 1000000 + round(
+        (seconds - whole_seconds) * 1e6
+    )
+    days, microseconds = divmod(microseconds, 86400000000)
+    seconds_, microseconds = divmod(microseconds, 1000000)
+    hours, seconds_ = divmod(seconds_, 3600)
+    minutes, seconds_ = divmod(seconds_, 60)
+
+    output = '%d:%02d:%02d' % (hours, minutes, seconds_)
+    if microseconds:
+        output += '.%06d' % microseconds
+    if days:
+        output = '%d day%s, %s' % (days, 's' if abs(days) != 1 else '', output)
+    return output
+
+
+def _format_timedelta(
+    timestamp: datetime.timedelta,
+    precision: datetime.timedelta,
+) -> str:
+    return _format_hms(timestamp.total_seconds(), precision.total_seconds())
+
+
+def _format_number(
+    timestamp: types.Number,
+    precision: datetime.timedelta,
+) -> str:
+    # Values outside of the `datetime.timedelta` range cannot be displayed.
+    # NaN passes both checks and raises a `ValueError` below, just like
+    # `datetime.timedelta(seconds=nan)` does.
+    if (
+        timestamp < _TIMEDELTA_MIN_SECONDS or
+        timestamp >= _TIMEDELTA_MAX_SECONDS
+    ):
+        return '--:--:--'
+
+    # Round to whole microseconds (half-even) the same way the
+    # `datetime.timedelta` constructor does
+    fraction, whole_seconds = math.modf(timestamp)
+    microseconds = int(whole_seconds) * 1000000 + round(fraction * 1e6)
+
+    return _format_hms(microseconds / 1000000, precision.total_seconds())
+
+
+def _format_str(timestamp: str, precision: datetime.timedelta) -> str:
+    return _format_number(float(timestamp), precision)
+
+
+def _format_datetime(
+    timestamp: datetime.datetime,
+    precision: datetime.timedelta,
+) -> str:
+    seconds = timestamp.timestamp()
+
+    # Truncate the number to the given precision
+    seconds = seconds - (seconds % precision.total_seconds())
+
+    try:
+        dt = datetime.datetime.fromtimestamp(seconds)
+    except ValueError:  # pragma: no cover
+        dt = datetime.datetime.max
+    return str(dt)
+
+
+def _format_date(
+    timestamp: datetime.date,
+    precision: datetime.timedelta,
+) -> str:
+    return str(timestamp)
+
+
+# The formatters for `format_time` by type. The order is significant for
+# subclasses as `datetime.datetime` is a subclass of `datetime.date`.
+_FORMATTERS: types.Dict[type, types.Callable[..., str]] = {
+    int: _format_number,
+    float: _format_number,
+    str: _format_str,
+    datetime.timedelta: _format_timedelta,
+    datetime.datetime: _format_datetime,
+    datetime.date: _format_date,
+}
+
+
 def format_time(
     timestamp: types.timestamp_type,
     precision: datetime.timedelta = datetime.timedelta(seconds=1)
@@ -80,6 +200,10 @@ def format_time(
     '0:00:01'
     >>> format_time(1.234)
     '0:00:01'
+    >>> format_time(0.9999999)
+    '0:00:01'
+    >>> format_time(86399.9999999)
+    '1 day, 0:00:00'
     >>> format_time(1)
     '0:00:01'
     >>> format_time(datetime.datetime(2000, 1, 2, 3, 4, 5, 6))
@@ -90,57 +214,46 @@ def format_time(
     '1:01:01'
     >>> format_time(None)
     '--:--:--'
+    >>> format_time(1e20)
+    '--:--:--'
+    >>> format_time(datetime.timedelta.max.total_seconds())
+    '--:--:--'
+    >>> format_time(datetime.timedelta.min.total_seconds())
+    '-999999999 days, 0:00:00'
+    >>> class Seconds(int): pass
+    >>> format_time(Seconds(61))
+    '0:01:01'
+    >>> format_time('nan')
+    Traceback (most recent call last):
+        ...
+    ValueError: cannot convert float NaN to integer
     >>> format_time(format_time)  # doctest: +ELLIPSIS
     Traceback (most recent call last):
         ...
     TypeError: Unknown type ...
 
     '''
-    precision_seconds = precision.total_seconds()
-
-    if isinstance(timestamp, str):
-        timestamp = float(timestamp)
+    if timestamp is None:
+        return '--:--:--'
 
-    if isinstance(timestamp, (int, float)):
-        try:
-            timestamp = datetime.timedelta(seconds=timestamp)
-        except OverflowError:  # pragma: no cover
-            timestamp = None
-
-    if isinstance(timestamp, datetime.timedelta):
-        seconds = timestamp.total_seconds()
-        # Truncate the number to the given precision
-        seconds = seconds - (seconds % precision_seconds)
-
-        return str(datetime.timedelta(seconds=seconds))
-    elif isinstance(timestamp, datetime.datetime):  # pragma: no cover
-        # Python 2 doesn't have the timestamp method
-        if hasattr(timestamp, 'timestamp'):
-            seconds = timestamp.timestamp()
+    formatter = _FORMATTERS.get(type(timestamp))
+    if formatter is None:
+        # Fall back to `isinstance` checks to support subclasses
+        for type_, formatter in _FORMATTERS.items():
+            if isinstance(timestamp, type_):
+                break
         else:
-            seconds = timedelta_to_seconds(timestamp - epoch)
-
-        # Truncate the number to the given precision
-        seconds = seconds - (seconds % precision_seconds)
-
-        try:  # pragma: no cover
-            dt = datetime.datetime.fromtimestamp(seconds)
-        except ValueError:  # pragma: no cover
-            dt = datetime.datetime.max
-        return str(dt)
-    elif isinstance(timestamp, datetime.date):
-        return str(timestamp)
-    elif timestamp is None:
-        return '--:--:--'
-    else:
-        raise TypeError('Unknown type %s: %r' % (type(timestamp), timestamp))
+            raise TypeError(
+                'Unknown type %s: %r' % (type(timestamp), timestamp)
+            )
+
+    return formatter(timestamp, precision)
 
 
 def timeout_generator(
     timeout: types.delta_type,
     interval: types.delta_type = datetime.timedelta(seconds=1),
-    iterable: types.Union[types.Iterable, types.Callable] =
-    itertools.count,
+    iterable: types.Union[types.Iterable, types.Callable, None] = None,
     interval_multiplier: float = 1.0,
     maximum_interval: types.Optional[types.delta_type] = None,
 ):
@@ -181,32 +294,52 @@ def timeout_generator(
     )
 
     iterable_: types.Iterable
-    if callable(iterable):
+    if iterable is None:
+        iterable_ = itertools.count()
+    elif callable(iterable):
         iterable_ = iterable()
     else:
         iterable_ = iterable
 
-    end = float_timeout + time.perf_counter()
+    # Bind the functions locally to avoid the attribute lookups in the loop
+    perf_counter_ns = time.perf_counter_ns
+    sleep = time.sleep
+    # The default fixed interval does not need updating after every item
+    update_interval = interval_multiplier != 1.0 or bool(
+        float_maximum_interval
+    )
+
+    end_ns: types.Number
+    if math.isfinite(float_timeout):
+        # Integer nanoseconds do not lose precision with a large process
+        # uptime
+        end_ns = perf_counter_ns() + int(float_timeout * 1e9)
+    else:
+        # An infinite timeout has no deadline, comparing against it directly
+        # keeps the loop the same
+        end_ns = float_timeout
     for item in iterable_:
         yield item
 
-        if time.perf_counter() >= end:
+        if perf_counter_ns() >= end_ns:
             break
 
-        time.sleep(float_interval)
+        sleep(float_interval)
 
-        interval *= interval_multiplier
-        if float_maximum_interval:
-            float_interval = min(float_interval, float_maximum_interval)
+        if update_interval:
+            float_interval *= interval_multiplier
+            if float_maximum_interval:
+                float_interval = min(float_interval, float_maximum_interval)
 
 
 async def aio_timeout_generator(
     timeout: types.delta_type,
     interval: types.delta_type = datetime.timedelta(seconds=1),
     iterable: types.Union[
-        types.AsyncIterable, types.Callable] = aio.acount,
+        types.AsyncIterable, types.Callable, None] = None,
     interval_multiplier: float = 1.0,
     maximum_interval: types.Optional[types.delta_type] = None,
+    yield_every: int = 1,
 ):
     '''
     Aync generator that walks through the given iterable (a counter by
@@ -218,10 +351,17 @@ async def aio_timeout_generator(
     will be used so the float_interval is always growing. To double the
     float_interval with each run, specify 2.
 
+    With an interval of 0 the generator only yields control to the event loop
+    (through `asyncio.sleep(0)`) once every `yield_every` items, which avoids
+    the event loop overhead for fast iterables.
+
     Doctests and asyncio are not friends, so no examples. But this function is
     effectively the same as the `timeout_generator` but it uses `async for`
     instead.
     '''
+    if yield_every < 1:
+        raise ValueError('yield_every must be at least 1: %r' % yield_every)
+
     float_timeout: float = delta_to_seconds(timeout)
     float_interval: float = delta_to_seconds(interval)
     float_maximum_interval: types.Optional[float] = delta_to_seconds_or_none(
@@ -229,23 +369,40 @@ async def aio_timeout_generator(
     )
 
     iterable_: types.AsyncIterable
-    if callable(iterable):
+    if iterable is None:
+        iterable_ = aio.acount()
+    elif callable(iterable):
         iterable_ = iterable()
     else:
         iterable_ = iterable
 
-    end = float_timeout + time.perf_counter()
+    # Bind the functions locally to avoid the attribute lookups in the loop
+    perf_counter = time.perf_counter
+    sleep = asyncio.sleep
+    iteration = 0
+    # The default fixed interval does not need updating after every item
+    update_interval = interval_multiplier != 1.0 or bool(
+        float_maximum_interval
+    )
+
+    end = float_timeout + perf_counter()
     async for item in iterable_:  # pragma: no branch
         yield item
 
-        if time.perf_counter() >= end:
+        if perf_counter() >= end:
             break
 
-        await asyncio.sleep(float_interval)
-
-        float_interval *= interval_multiplier
-        if float_maximum_interval:  # pragma: no branch
-            float_interval = min(float_interval, float_maximum_interval)
+        if float_interval > 0:
+            await sleep(float_interval)
+        else:
+            iteration += 1
+            if iteration % yield_every == 0:
+                await sleep(0)
+
+        if update_interval:
+            float_interval *= interval_multiplier
+            if float_maximum_interval:  # pragma: no branch
+                float_interval = min(float_interval, float_maximum_interval)
 
 
 async def aio_generator_timeout_detector(